@@ -8,19 +8,24 @@ setup(
     author_email="",
     url="https://github.com/yourusername/vtt-timecode-processor",
     packages=find_packages(),
+    extras_require={
+        # Faster DFA-based matching for the timecode patterns
+        "re2": ["google-re2"],
+        # JIT-compiled fast path for zeroing VTT hours
+        "numba": ["numba", "numpy"],
+    },
     entry_points={
         "console_scripts": [
             "vtt-processor=vtt_processor:main",
         ],
     },
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     classifiers=[
         "Development Status :: 4 - Beta",
         "Environment :: GUI",
         "Intended Audience :: End Users/Desktop",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
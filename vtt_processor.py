@@ -1,11 +1,34 @@
 import os
-import re
+import mmap
+import multiprocessing
+import hashlib
+import shutil
 import logging
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
-from typing import List, Tuple, Optional
-from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 import threading
+import time
+from contextlib import contextmanager
+from functools import partial
+
+# Prefer RE2's DFA matcher when it is installed; the API used here is re-compatible
+try:
+    import re2 as _re
+    _RE_ACCEPTS_BUFFERS = False  # re2 only matches str/bytes, not mmap objects
+except ImportError:
+    import re as _re
+    _RE_ACCEPTS_BUFFERS = True
+
+# Optional Numba JIT fast path for zeroing VTT hours on raw bytes
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
 
 # Setup logging configuration
 logging.basicConfig(
@@ -18,11 +41,163 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Precompile regex patterns for efficiency
-VTT_TIMECODE_PATTERN = re.compile(
-    r"(\d{2}):(\d{2}):(\d{2}\.\d{3}) --> (\d{2}):(\d{2}):(\d{2}\.\d{3})"
+# Precompile regex patterns for efficiency. VTT cue timings start a line, so
+# the pattern is anchored to fail fast on cue text lines. Files are handled as
+# raw bytes: timecodes are pure ASCII, so UTF-8 subtitle text passes through
+# untouched without a decode/encode round trip. Line endings are kept as-is,
+# so a line may also start after a bare CR (old Mac-style files)
+VTT_TIMECODE_PATTERN = _re.compile(
+    rb"(?m)((?:^|\r)[ \t]*)(\d{2}):(\d{2}):(\d{2}\.\d{3}) --> (\d{2}):(\d{2}):(\d{2}\.\d{3})"
 )
-SRT_TIMECODE_PATTERN = re.compile(r"(\d{2}):(\d{2}):(\d{2}),(\d{3})")
+# SRT timecodes are only rewritten as a full 'start --> end' timing, so
+# timecode-like text in subtitle lines keeps its commas
+SRT_TIMECODE_PATTERN = _re.compile(
+    rb"(\d{2}:\d{2}:\d{2}),(\d{3}) --> (\d{2}:\d{2}:\d{2}),(\d{3})"
+)
+
+# Prebuilt replacement templates and output fragments, expanded by the regex
+# engine without any per-match Python formatting
+VTT_ZERO_HOURS_TEMPLATE = rb"\g<1>00:\3:\4 --> 00:\6:\7"
+SRT_TO_VTT_TEMPLATE = rb"\1.\2 --> \3.\4"
+VTT_HEADER = b"WEBVTT"
+
+# Minimum seconds between progress updates (caps UI refreshes at ~20 Hz)
+UI_UPDATE_INTERVAL = 0.05
+
+# Batches with less input than this (total bytes) are processed sequentially.
+# Spawning the worker pool takes ~0.6 s (each worker re-imports tkinter, numpy
+# and numba), which sequential processing covers for ~150 MB on the Numba path
+# (~250 MB/s) but only ~7 MB on the regex path (~3-11 MB/s)
+PARALLEL_MIN_BYTES_NUMBA = 256 << 20
+PARALLEL_MIN_BYTES_REGEX = 16 << 20
+
+
+def _strip_vtt_suffix(name: str) -> str:
+    """Returns a VTT file name without its '.mp4.vtt' or '.vtt' extension."""
+    if name.endswith(".mp4.vtt"):
+        return name[:-8]
+    if name.endswith(".vtt"):
+        return name[:-4]
+    return name
+
+
+def _is_vtt_timestamp_text(text: str) -> bool:
+    """Checks whether text is exactly an 'HH:MM:SS.mmm' timestamp."""
+    return len(text) == 12 and text[2] == ":" and text[5] == ":" and text[8] == "." \
+        and (text[:2] + text[3:5] + text[6:8] + text[9:]).isdigit()
+
+
+def _vtt_header(data) -> bytes:
+    """
+    Builds the VTT header using the same line ending as the input, so CRLF or
+    CR files don't end up with mixed line endings.
+    
+    Args:
+        data: Raw contents of the input file
+        
+    Returns:
+        The header followed by a blank line
+    """
+    lf = data.find(b"\n")
+    if lf > 0 and data[lf - 1:lf] == b"\r":
+        newline = b"\r\n"
+    elif lf < 0 and data.find(b"\r") >= 0:
+        newline = b"\r"
+    else:
+        newline = b"\n"
+    return VTT_HEADER + newline + newline
+
+
+@contextmanager
+def _map_input(input_path: str):
+    """
+    Memory-maps a file read-only so it can be scanned without copying it into
+    a Python buffer first.
+    
+    Args:
+        input_path: Path to the file to map
+        
+    Yields:
+        A read-only mmap of the file, or b"" for an empty file (which can't be mapped)
+    """
+    with open(input_path, "rb") as infile:
+        if os.fstat(infile.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _is_vtt_timestamp(buf, start):
+        """Checks for an 'HH:MM:SS.mmm' timestamp at buf[start:start + 12]."""
+        if start < 0 or start + 12 > buf.size:
+            return False
+        if buf[start + 2] != 58 or buf[start + 5] != 58 or buf[start + 8] != 46:  # ':', ':', '.'
+            return False
+        for k in (0, 1, 3, 4, 6, 7, 9, 10, 11):
+            if buf[start + k] < 48 or buf[start + k] > 57:  # not '0'-'9'
+                return False
+        return True
+
+    @njit(cache=True)
+    def _zero_hours_vtt_bytes(buf):
+        """
+        Zeroes the hour fields of every VTT cue timing line in buf, in place.
+        Matches the same lines as VTT_TIMECODE_PATTERN.
+
+        Args:
+            buf: Writable uint8 array holding the raw file contents
+
+        Returns:
+            The same array, for convenience
+        """
+        n = buf.size
+        i = 12
+        while i + 17 <= n:
+            # Look for ' --> ' with a full timestamp on either side
+            if buf[i] == 32 and buf[i + 1] == 45 and buf[i + 2] == 45 and buf[i + 3] == 62 \
+                    and buf[i + 4] == 32 and _is_vtt_timestamp(buf, i - 12) \
+                    and _is_vtt_timestamp(buf, i + 5):
+                # Only spaces or tabs may precede the timing on its line
+                j = i - 13
+                while j >= 0 and (buf[j] == 32 or buf[j] == 9):
+                    j -= 1
+                if j < 0 or buf[j] == 10 or buf[j] == 13:  # '\n' or a bare '\r'
+                    buf[i - 12] = 48
+                    buf[i - 11] = 48
+                    buf[i + 5] = 48
+                    buf[i + 6] = 48
+                    i += 17
+                    continue
+            i += 1
+        return buf
+else:
+    _zero_hours_vtt_bytes = None
+
+
+def _disable_numba_fast_path(error: Exception):
+    """
+    Switches this process to the regex path after the Numba fast path failed
+    to compile or run (e.g. version mismatch or an unwritable cache).
+    
+    Args:
+        error: The exception raised by the Numba path
+    """
+    global _zero_hours_vtt_bytes
+    if _zero_hours_vtt_bytes is not None:
+        _zero_hours_vtt_bytes = None
+        logger.warning(f"Numba fast path unavailable, using regex processing instead: {error}")
+
+
+def _warm_up_numba_fast_path():
+    """Compiles (or loads the cached build of) the Numba fast path ahead of use."""
+    try:
+        _zero_hours_vtt_bytes(np.zeros(32, dtype=np.uint8))
+    except Exception as e:
+        _disable_numba_fast_path(e)
+
 
 class FileProcessor:
     """Handles all file processing operations for VTT and SRT files."""
@@ -32,18 +207,28 @@ class FileProcessor:
         """
         Adjusts a VTT timecode line by setting the hour part to '00'.
         
+        The file converters rewrite whole files in one pass and don't call this;
+        it is kept as public API for callers working line by line.
+        
         Args:
             line: A string potentially containing a VTT timecode
             
         Returns:
             The adjusted line with zeroed hour values
         """
-        match = VTT_TIMECODE_PATTERN.search(line)
-        if match:
-            mm1, ss1, mm2, ss2 = match.group(2), match.group(3), match.group(5), match.group(6)
-            new_timecode = f"00:{mm1}:{ss1} --> 00:{mm2}:{ss2}"
-            return VTT_TIMECODE_PATTERN.sub(new_timecode, line)
-        return line
+        # Cheap literal test first - most lines in a VTT file are cue text
+        if " --> " not in line:
+            return line
+
+        # Timecodes are fixed width (HH:MM:SS.mmm), so the hour fields sit at
+        # known offsets around the arrow. Like VTT_TIMECODE_PATTERN, both sides
+        # must be full timestamps and only whitespace may precede the first
+        i = line.find(" --> ")
+        if i < 12 or not _is_vtt_timestamp_text(line[i - 12:i]) \
+                or not _is_vtt_timestamp_text(line[i + 5:i + 17]) \
+                or line[:i - 12].strip(" \t"):
+            return line
+        return line[:i - 12] + "00" + line[i - 10:i + 5] + "00" + line[i + 7:]
 
     @staticmethod
     def convert_srt_to_vtt(input_path: str, output_path: str) -> bool:
@@ -58,20 +243,108 @@ class FileProcessor:
             True if conversion was successful, False otherwise
         """
         try:
-            with open(input_path, "r", encoding="utf-8") as srt_file, \
-                 open(output_path, "w", encoding="utf-8") as vtt_file:
-                # Write the VTT header
-                vtt_file.write("WEBVTT\n\n")
-                for line in srt_file:
-                    # Replace comma in timecode with period
-                    line = SRT_TIMECODE_PATTERN.sub(lambda m: f"{m.group(1)}:{m.group(2)}:{m.group(3)}.{m.group(4)}", line)
-                    vtt_file.write(line)
+            with _map_input(input_path) as data, \
+                 open(output_path, "wb") as vtt_file:
+                # Replace comma in cue timings with period in a single pass over
+                # the whole file, then write it out behind the VTT header
+                vtt_file.write(_vtt_header(data))
+                vtt_file.write(SRT_TIMECODE_PATTERN.sub(
+                    SRT_TO_VTT_TEMPLATE, data if _RE_ACCEPTS_BUFFERS else data[:]
+                ))
             logger.info(f"Converted {input_path} to {output_path}")
             return True
         except Exception as e:
             logger.error(f"Error converting {input_path}: {e}")
             return False
             
+    @staticmethod
+    def file_digest(input_path: str) -> Optional[bytes]:
+        """
+        Computes a content hash used to detect duplicate input files.
+        
+        Args:
+            input_path: Path to the file to hash
+            
+        Returns:
+            A short BLAKE2b digest of the file contents, or None if it can't be read
+        """
+        try:
+            with _map_input(input_path) as data:
+                return hashlib.blake2b(data, digest_size=16).digest()
+        except OSError as e:
+            logger.warning(f"Could not hash {input_path}: {e}")
+            return None
+
+    @staticmethod
+    def file_sizes(input_paths: List[str]) -> Dict[str, int]:
+        """
+        Looks up the size of every file in a batch.
+        
+        Args:
+            input_paths: Paths of all files in the batch
+            
+        Returns:
+            Size in bytes of each file that could be stat'ed; the others are left
+            to the converter to report
+        """
+        sizes = {}
+        for input_path in input_paths:
+            try:
+                sizes[input_path] = os.stat(input_path).st_size
+            except OSError:
+                continue
+        return sizes
+
+    @staticmethod
+    def duplicate_digests(file_sizes: Dict[str, int]) -> Dict[str, bytes]:
+        """
+        Hashes only the files that could be duplicates. Sizes are compared first,
+        so a file with a unique size is never read here, only by its converter.
+        
+        Args:
+            file_sizes: Size of each file in the batch, from file_sizes()
+            
+        Returns:
+            Content digests for files that share their size with another file
+        """
+        by_size = {}
+        for input_path, size in file_sizes.items():
+            by_size.setdefault(size, []).append(input_path)
+        
+        digests = {}
+        for same_size in by_size.values():
+            if len(same_size) < 2:
+                continue
+            for input_path in same_size:
+                digest = FileProcessor.file_digest(input_path)
+                if digest is not None:
+                    digests[input_path] = digest
+        return digests
+
+    @staticmethod
+    def copy_output(source_path: str, output_path: str) -> bool:
+        """
+        Reuses an already processed file as the output for a duplicate input.
+        
+        Args:
+            source_path: Path of the output written for the original input
+            output_path: Path where the copy will be saved
+            
+        Returns:
+            True if the copy was successful, False otherwise
+        """
+        # Identical inputs renamed to the same output name already share the file
+        if source_path == output_path:
+            logger.info(f"Duplicate output {output_path} already written")
+            return True
+        try:
+            shutil.copyfile(source_path, output_path)
+            logger.info(f"Copied duplicate output {source_path} -> {output_path}")
+            return True
+        except Exception as e:
+            logger.error(f"Error copying {source_path} to {output_path}: {e}")
+            return False
+
     @staticmethod
     def process_vtt_file(input_path: str, output_path: str) -> bool:
         """
@@ -85,10 +358,24 @@ class FileProcessor:
             True if processing was successful, False otherwise
         """
         try:
-            with open(input_path, "r", encoding="utf-8") as infile, \
-                 open(output_path, "w", encoding="utf-8") as outfile:
-                for line in infile:
-                    outfile.write(FileProcessor.adjust_timecode_vtt(line))
+            # Subtitle files are small, so rewrite the whole file in one pass
+            # rather than dispatching per line
+            with _map_input(input_path) as data:
+                result = None
+                if _zero_hours_vtt_bytes is not None:
+                    # Numba fast path: patch the hour digits in a private copy of the mapping
+                    try:
+                        buf = np.frombuffer(data, dtype=np.uint8).copy()
+                        result = _zero_hours_vtt_bytes(buf).tobytes()
+                    except Exception as e:
+                        _disable_numba_fast_path(e)
+                if result is None:
+                    result = VTT_TIMECODE_PATTERN.sub(
+                        VTT_ZERO_HOURS_TEMPLATE, data if _RE_ACCEPTS_BUFFERS else data[:]
+                    )
+
+            with open(output_path, "wb") as outfile:
+                outfile.write(result)
             logger.info(f"Processed {input_path} -> {output_path}")
             return True
         except Exception as e:
@@ -109,11 +396,24 @@ class VTTTimecodeZeroerApp(tk.Tk):
         self.processor = FileProcessor()
         self.processing_thread = None
         self.is_processing = False
+        # Names entered in the rename prompt, keyed by original file name, so
+        # recurring files don't trigger the dialog again within a batch
+        self._rename_cache = {}
+        # Worker pool, created on first use and reused across batches
+        self._executor = None
         
         # Create GUI elements
         self.create_widgets()
         self.apply_theme()
         
+        # Compile the Numba fast path in the background while the user picks
+        # directories, so the first file doesn't pay the JIT cost. The compiled
+        # code in memory only serves this process (sequential batches); worker
+        # processes are spawned, never forked, so they can't inherit Numba's
+        # compiler lock mid-compile, and they load the cache=True build from disk
+        if _zero_hours_vtt_bytes is not None:
+            threading.Thread(target=_warm_up_numba_fast_path, daemon=True).start()
+        
         # Set up protocol for window close
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
     
@@ -190,9 +490,9 @@ class VTTTimecodeZeroerApp(tk.Tk):
             .grid(row=1, column=2, sticky="W", padx=5)
         
         # Batch processing options
-        ttk.Label(self.main_frame, text="Multithreading:").grid(row=5, column=0, sticky="W", padx=5, pady=5)
-        self.use_threads_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(self.main_frame, text="Use multithreading for faster processing", variable=self.use_threads_var)\
+        ttk.Label(self.main_frame, text="Parallel Processing:").grid(row=5, column=0, sticky="W", padx=5, pady=5)
+        self.use_parallel_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(self.main_frame, text="Use multiple processes for faster processing", variable=self.use_parallel_var)\
             .grid(row=5, column=1, sticky="W", padx=5, pady=5)
 
         # Start processing button
@@ -228,15 +528,16 @@ class VTTTimecodeZeroerApp(tk.Tk):
         if directory:
             self.output_dir_var.set(directory)
 
-    def rename_file(self, output_directory: str, file_name: str, index: int) -> str:
+    def rename_file(self, output_prefix: str, file_name: str, index: int) -> str:
         """
         Handles file naming based on selected options:
         1. Default naming: original_name_index.vtt
-        2. User prompt: asks for a new name for each file
+        2. User prompt: asks for a new name for each file (answers are reused
+           for recurring file names within a batch)
         3. Sequential numbering: prefix1.vtt, prefix2.vtt, etc.
         
         Args:
-            output_directory: Directory where the file will be saved
+            output_prefix: Output directory path ending with a path separator
             file_name: Original file name (without extension)
             index: Index of the file in the batch process
             
@@ -250,25 +551,30 @@ class VTTTimecodeZeroerApp(tk.Tk):
                 new_name = f"{prefix}{index}"
             else:
                 new_name = f"{index}"
-            return os.path.join(output_directory, f"{new_name}.vtt")
+            return f"{output_prefix}{new_name}.vtt"
             
         # If rename option is checked, prompt user for name
         elif self.rename_var.get():
-            new_name = simpledialog.askstring(
-                "Rename", 
-                f"Enter new name for {file_name} (leave blank to keep original name):"
-            )
+            if file_name in self._rename_cache:
+                new_name = self._rename_cache[file_name]
+            else:
+                new_name = simpledialog.askstring(
+                    "Rename", 
+                    f"Enter new name for {file_name} (leave blank to keep original name):"
+                )
+                if new_name and new_name.strip():
+                    self._rename_cache[file_name] = new_name
             
             if new_name is None or new_name.strip() == "":
                 new_name = file_name
             else:
                 new_name = f"{new_name.strip()}_{index}"
                 
-            return os.path.join(output_directory, f"{new_name}.vtt")
+            return f"{output_prefix}{new_name}.vtt"
             
         # Default naming scheme
         else:
-            return os.path.join(output_directory, f"{file_name}_{index}.vtt")
+            return f"{output_prefix}{file_name}_{index}.vtt"
 
     def start_processing(self):
         """Validates inputs and starts the processing thread."""
@@ -318,6 +624,10 @@ class VTTTimecodeZeroerApp(tk.Tk):
         try:
             self.process_files(choice, input_dir, output_dir)
         except Exception as e:
+            if isinstance(e, BrokenProcessPool) and self._executor is not None:
+                # A worker died and the shared pool is unusable; start a fresh one next batch
+                self._executor.shutdown(wait=False)
+                self._executor = None
             logger.error(f"Error during processing: {e}")
             self.after(0, lambda: messagebox.showerror("Error", f"An error occurred: {e}"))
         finally:
@@ -329,6 +639,23 @@ class VTTTimecodeZeroerApp(tk.Tk):
         self.start_button.config(state="normal")
         self.status_var.set("Ready")
 
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """
+        Returns the worker process pool, creating it on first use.
+        
+        Workers are spawned rather than forked: this process runs several threads
+        (Tk, processing, Numba warm-up), and a forked child would inherit any lock
+        they hold. Spawned workers start on demand and the pool is kept for the
+        whole session, so each worker pays the module import cost only once.
+        
+        Returns:
+            The shared ProcessPoolExecutor
+        """
+        if self._executor is None:
+            # Default worker count is cpu_count(), capped at 61 on Windows
+            self._executor = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+
     def process_files(self, choice: str, input_dir: str, output_dir: str):
         """
         Processes files based on the selected option: either adjusts VTT timecodes or converts SRT to VTT.
@@ -338,11 +665,14 @@ class VTTTimecodeZeroerApp(tk.Tk):
             input_dir: Input directory path
             output_dir: Output directory path
         """
-        # Get list of files to process
-        if choice == "vtt":
-            files = [f for f in os.listdir(input_dir) if f.lower().endswith(".vtt")]
-        else:  # choice == "srt"
-            files = [f for f in os.listdir(input_dir) if f.lower().endswith(".srt")]
+        # Rename answers only apply to the batch they were given in
+        self._rename_cache.clear()
+
+        # Get list of files to process (scandir entries skip subdirectories
+        # without an extra stat call per name)
+        extension = ".vtt" if choice == "vtt" else ".srt"
+        with os.scandir(input_dir) as entries:
+            files = [e.name for e in entries if e.is_file() and e.name.lower().endswith(extension)]
 
         total_files = len(files)
         if total_files == 0:
@@ -353,70 +683,123 @@ class VTTTimecodeZeroerApp(tk.Tk):
         self.after(0, lambda: self.progress_bar.config(maximum=total_files))
         self.after(0, lambda: self.progress_label.config(text=f"Processing {total_files} files..."))
         
-        # Process files (with or without multithreading)
+        # Join directory and separator once; per-file paths are then plain
+        # string concatenation instead of an os.path.join call each
+        input_prefix = os.path.join(input_dir, "")
+        output_prefix = os.path.join(output_dir, "")
+        
+        # Process files (with or without worker processes)
         processed_count = 0
         failed_count = 0
+        last_ui_update = 0.0
+        
+        # Inputs with identical contents are only processed once; later copies
+        # reuse the first output (content digest -> output path)
+        sizes = FileProcessor.file_sizes([input_prefix + file_name for file_name in files])
+        digests = FileProcessor.duplicate_digests(sizes)
+        first_outputs = {}
+        
+        # Only large batches amortize the worker start-up; SRT conversion always
+        # runs on the regex path
+        if choice == "vtt" and _zero_hours_vtt_bytes is not None:
+            parallel_min_bytes = PARALLEL_MIN_BYTES_NUMBA
+        else:
+            parallel_min_bytes = PARALLEL_MIN_BYTES_REGEX
         
-        if self.use_threads_var.get() and total_files > 1:
-            # Use multithreading for faster processing
-            with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 2, 4)) as executor:
-                futures = []
+        if self.use_parallel_var.get() and total_files > 1 and sum(sizes.values()) >= parallel_min_bytes:
+            # Regex work holds the GIL, so use worker processes to spread it
+            # across all cores; UI updates stay on this thread via self.after
+            executor = self._get_executor()
+            futures = {}
+            submitted = set()
+            duplicates = []
+            
+            # Submit all tasks to the executor
+            for index, file_name in enumerate(files, start=1):
+                input_path = input_prefix + file_name
                 
-                # Submit all tasks to the executor
-                for index, file_name in enumerate(files, start=1):
-                    input_path = os.path.join(input_dir, file_name)
-                    
-                    if choice == "vtt":
-                        # Clean up file name for VTT files
-                        base_name = file_name.replace(".mp4.vtt", "").replace(".vtt", "")
-                        output_path = self.rename_file(output_dir, base_name, index)
-                        futures.append(
-                            executor.submit(FileProcessor.process_vtt_file, input_path, output_path)
-                        )
-                    else:  # choice == "srt"
-                        base_name = file_name.replace(".srt", "")
-                        output_path = self.rename_file(output_dir, base_name, index)
-                        futures.append(
-                            executor.submit(FileProcessor.convert_srt_to_vtt, input_path, output_path)
-                        )
+                if choice == "vtt":
+                    # Clean up file name for VTT files
+                    base_name = _strip_vtt_suffix(file_name)
+                    converter = FileProcessor.process_vtt_file
+                else:  # choice == "srt"
+                    base_name = file_name[:-4] if file_name.endswith(".srt") else file_name
+                    converter = FileProcessor.convert_srt_to_vtt
+                output_path = self.rename_file(output_prefix, base_name, index)
                 
-                # Process results as they complete
-                for i, future in enumerate(futures):
-                    if future.result():
-                        processed_count += 1
+                digest = digests.get(input_path)
+                if digest is not None and digest in submitted:
+                    duplicates.append((digest, converter, input_path, output_path))
+                    continue
+                if digest is not None:
+                    submitted.add(digest)
+                futures[executor.submit(converter, input_path, output_path)] = (digest, output_path)
+            
+            def results():
+                # Results in completion order so a slow file doesn't hold back
+                # progress for the ones that finish after it. An original's output
+                # is only reused once its conversion has succeeded
+                for future in as_completed(futures):
+                    digest, output_path = futures[future]
+                    result = future.result()
+                    if result and digest is not None:
+                        first_outputs[digest] = output_path
+                    yield result
+                # Duplicates copy their original's output, or are processed
+                # themselves if the original failed
+                for digest, converter, input_path, output_path in duplicates:
+                    if digest in first_outputs:
+                        yield FileProcessor.copy_output(first_outputs[digest], output_path)
                     else:
-                        failed_count += 1
-                    
-                    # Update progress bar
-                    progress = (i + 1) / total_files * 100
-                    self.after(0, lambda p=progress: self.progress_var.set(p))
-                    self.after(0, lambda c=processed_count, f=failed_count: 
-                              self.status_var.set(f"Processed: {c}, Failed: {f}"))
+                        yield converter(input_path, output_path)
+            
+            for done_count, result in enumerate(results(), start=1):
+                if result:
+                    processed_count += 1
+                else:
+                    failed_count += 1
+                
+                # Update progress bar (throttled so large batches don't flood the Tk queue)
+                now = time.monotonic()
+                if now - last_ui_update > UI_UPDATE_INTERVAL or done_count == total_files:
+                    last_ui_update = now
+                    self.after(0, partial(self.progress_var.set, done_count / total_files * 100))
+                    self.after(0, partial(self.status_var.set,
+                                          f"Processed: {processed_count}, Failed: {failed_count}"))
         else:
             # Process files sequentially
             for index, file_name in enumerate(files, start=1):
-                input_path = os.path.join(input_dir, file_name)
+                input_path = input_prefix + file_name
                 
                 if choice == "vtt":
                     # Clean up file name for VTT files
-                    base_name = file_name.replace(".mp4.vtt", "").replace(".vtt", "")
-                    output_path = self.rename_file(output_dir, base_name, index)
-                    result = FileProcessor.process_vtt_file(input_path, output_path)
+                    base_name = _strip_vtt_suffix(file_name)
+                    converter = FileProcessor.process_vtt_file
                 else:  # choice == "srt"
-                    base_name = file_name.replace(".srt", "")
-                    output_path = self.rename_file(output_dir, base_name, index)
-                    result = FileProcessor.convert_srt_to_vtt(input_path, output_path)
+                    base_name = file_name[:-4] if file_name.endswith(".srt") else file_name
+                    converter = FileProcessor.convert_srt_to_vtt
+                output_path = self.rename_file(output_prefix, base_name, index)
+                
+                digest = digests.get(input_path)
+                if digest in first_outputs:
+                    result = FileProcessor.copy_output(first_outputs[digest], output_path)
+                else:
+                    result = converter(input_path, output_path)
+                    if result and digest is not None:
+                        first_outputs[digest] = output_path
                 
                 if result:
                     processed_count += 1
                 else:
                     failed_count += 1
                 
-                # Update progress bar
-                progress = index / total_files * 100
-                self.after(0, lambda p=progress: self.progress_var.set(p))
-                self.after(0, lambda c=processed_count, f=failed_count: 
-                          self.status_var.set(f"Processed: {c}, Failed: {f}"))
+                # Update progress bar (throttled so large batches don't flood the Tk queue)
+                now = time.monotonic()
+                if now - last_ui_update > UI_UPDATE_INTERVAL or index == total_files:
+                    last_ui_update = now
+                    self.after(0, partial(self.progress_var.set, index / total_files * 100))
+                    self.after(0, partial(self.status_var.set,
+                                          f"Processed: {processed_count}, Failed: {failed_count}"))
         
         # Show completion message
         completion_message = f"Processing complete.\nSuccessfully processed: {processed_count}\nFailed: {failed_count}"
@@ -425,13 +808,14 @@ class VTTTimecodeZeroerApp(tk.Tk):
     def on_closing(self):
         """Handles the window close event, ensuring clean shutdown even during processing."""
         if self.is_processing:
-            if messagebox.askyesno("Exit", "Processing is in progress. Are you sure you want to exit?"):
-                # If processing thread exists, we can't directly terminate it
-                # But we can mark our flag so the UI updates properly on exit
-                self.is_processing = False
-                self.destroy()
-        else:
-            self.destroy()
+            if not messagebox.askyesno("Exit", "Processing is in progress. Are you sure you want to exit?"):
+                return
+            # If processing thread exists, we can't directly terminate it
+            # But we can mark our flag so the UI updates properly on exit
+            self.is_processing = False
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self.destroy()
 
 
 if __name__ == "__main__":